@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import heapq
 import math
 import re
 from collections import Counter
-from typing import Any, Dict, List, Tuple
+from itertools import repeat
+from typing import Any, Dict, List, Optional, Tuple
 
 _SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_TOKEN_RE = re.compile(r"\b\w+\b")
 
 def _tokenize(text: str) -> List[str]:
-    return re.findall(r"\b\w+\b", text.lower())
+    return [match.group().lower() for match in _TOKEN_RE.finditer(text)]
 
 def _split_sentences(text: str) -> List[str]:
     text = text.strip()
@@ -17,52 +20,56 @@ def _split_sentences(text: str) -> List[str]:
     sentences = _SENTENCE_SPLIT_RE.split(text)
     return [s.strip() for s in sentences if s.strip()]
 
-def _score_sentences(sentences: List[str], query_tokens: List[str]) -> List[Tuple[int, float]]:
+def _top_sentences(
+    sentences: List[str],
+    weights: Dict[str, float],
+    k: int,
+) -> Tuple[List[Tuple[int, float]], float]:
     """
-    Assign a relevance score to each sentence based on query term overlap.
-    Returns a list of (index, score).
-    """
-    if not sentences:
-        return []
+    Score every sentence by IDF-weighted query term overlap in a single pass,
+    keeping only the k best in a bounded heap.
 
-    query_token_set = set(query_tokens)
-    scores: List[Tuple[int, float]] = []
+    Returns the top (index, score) pairs, best first, and the sum of all
+    sentence scores. Ties favour earlier sentences.
+    """
+    heap: List[Tuple[float, int]] = []
+    total = 0.0
 
     for idx, sentence in enumerate(sentences):
         tokens = _tokenize(sentence)
-        if not tokens:
-            scores.append((idx, 0.0))
-            continue
-
-        token_counts = Counter(tokens)
-        overlap = sum(token_counts[t] for t in query_token_set if t in token_counts)
-
-        # Normalize by sentence length
-        score = overlap / math.sqrt(len(tokens))
-        scores.append((idx, score))
-
-    return scores
-
-def _compute_overall_score(scores: List[Tuple[int, float]]) -> int:
+        if tokens:
+            # Tokens outside the query map to 0.0 so the sum runs entirely in C.
+            weighted_overlap = sum(map(weights.get, tokens, repeat(0.0)))
+            # Normalize by sentence length
+            score = weighted_overlap / math.sqrt(len(tokens))
+        else:
+            score = 0.0
+        total += score
+
+        entry = (score, -idx)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+
+    top = [(-neg_idx, score) for score, neg_idx in sorted(heap, reverse=True)]
+    return top, total
+
+def _compute_overall_score(max_score: float, avg_score: float) -> int:
     """
     Convert sentence scores into a 0-100 relevance score.
     """
-    if not scores:
-        return 0
-
-    raw_scores = [s for _, s in scores]
-    max_score = max(raw_scores)
     if max_score <= 0:
         return 40  # low but non-zero baseline for unknown relevance
 
-    avg_score = sum(raw_scores) / len(raw_scores)
     normalized = min(1.0, (avg_score / max_score))
     return int(50 + 50 * normalized)
 
-def summarize(
+def _summarize_one(
     text: str,
     *,
     query: str,
+    weights: Dict[str, float],
     metadata_title: str | None = None,
     max_sentences: int = 3,
 ) -> Dict[str, Any]:
@@ -71,11 +78,13 @@ def summarize(
 
     This is intentionally simple and self-contained:
     - Splits the article into sentences.
-    - Scores each sentence based on query term overlap.
+    - Scores each sentence based on IDF-weighted query term overlap.
     - Returns the top N sentences as a markdown bullet list.
+
+    weights maps query terms to their IDF weights; it is precomputed so a
+    batch tokenizes the query and resolves IDF values only once.
     """
     text = text.strip()
-    query_tokens = _tokenize(query)
 
     if not text:
         title = metadata_title or (query or "Untitled")
@@ -94,25 +103,139 @@ def summarize(
             "score": 0,
         }
 
-    scores = _score_sentences(sentences, query_tokens)
-    sorted_by_score = sorted(scores, key=lambda x: x[1], reverse=True)
+    if not weights:
+        # Without query terms every sentence scores zero, so skip scoring.
+        top_scores: List[Tuple[int, float]] = []
+        overall_score = 40
+    else:
+        # Always track at least one sentence so the max score is known.
+        top_scores, total = _top_sentences(sentences, weights, max(max_sentences, 1))
+        overall_score = _compute_overall_score(top_scores[0][1], total / len(sentences))
+        top_scores = top_scores[:max_sentences]
 
     # If every score is zero, fall back to the first few sentences in order.
-    if all(score <= 0 for _, score in sorted_by_score):
+    if not top_scores or top_scores[0][1] <= 0:
         selected_indices = list(range(min(max_sentences, len(sentences))))
     else:
-        top_indices = [idx for idx, _ in sorted_by_score[:max_sentences]]
-        selected_indices = sorted(top_indices)
+        selected_indices = sorted(idx for idx, _ in top_scores)
 
     bullets = [f"- {sentences[idx]}" for idx in selected_indices]
     summary_md = "\n".join(bullets)
 
-    overall_score = _compute_overall_score(sorted_by_score)
-
     title = metadata_title or sentences[0][:120] or (query or "Untitled")
 
     return {
         "title": title,
         "summary": summary_md,
         "score": overall_score,
-    }
\ No newline at end of file
+    }
+
+class Summarizer:
+    """
+    Query-focused summarizer with TF-IDF sentence scoring.
+
+    Every sentence of every document added via add_document() counts as one
+    IDF document, so query terms that are rare across the session outweigh
+    ones that appear everywhere.
+    """
+
+    def __init__(self) -> None:
+        self.df: Counter[str] = Counter()
+        self.n_docs = 0
+        self._idf_cache: Dict[str, float] = {}
+
+    def add_document(self, text: str) -> None:
+        """
+        Update document frequencies with the sentences of an article.
+        """
+        for sentence in _split_sentences(text):
+            self.df.update(set(_tokenize(sentence)))
+            self.n_docs += 1
+        self._idf_cache.clear()
+
+    def idf(self, token: str) -> float:
+        """
+        Smoothed inverse document frequency; always positive so that a
+        term present in every sentence still counts a little.
+        """
+        weight = self._idf_cache.get(token)
+        if weight is None:
+            weight = math.log(1 + self.n_docs / (1 + self.df[token]))
+            self._idf_cache[token] = weight
+        return weight
+
+    def query_weights(self, query: str) -> Dict[str, float]:
+        """
+        Map each distinct query term to its current IDF weight.
+        """
+        return {t: self.idf(t) for t in frozenset(_tokenize(query))}
+
+    def summarize(
+        self,
+        text: str,
+        *,
+        query: str,
+        metadata_title: str | None = None,
+        max_sentences: int = 3,
+    ) -> Dict[str, Any]:
+        """
+        Summarize one article against the IDF statistics collected so far.
+        """
+        return _summarize_one(
+            text,
+            query=query,
+            weights=self.query_weights(query),
+            metadata_title=metadata_title,
+            max_sentences=max_sentences,
+        )
+
+def summarize(
+    text: str,
+    *,
+    query: str,
+    metadata_title: str | None = None,
+    max_sentences: int = 3,
+) -> Dict[str, Any]:
+    """
+    Summarize a single article, using its own sentences for IDF statistics.
+    """
+    summarizer = Summarizer()
+    if _TOKEN_RE.search(query):
+        summarizer.add_document(text)
+    return summarizer.summarize(
+        text,
+        query=query,
+        metadata_title=metadata_title,
+        max_sentences=max_sentences,
+    )
+
+def summarize_many(
+    texts: List[str],
+    *,
+    query: str,
+    metadata_titles: Optional[List[str | None]] = None,
+    max_sentences: int = 3,
+) -> List[Dict[str, Any]]:
+    """
+    Summarize a batch of articles with IDF statistics pooled across all of them.
+
+    Results are returned in the same order as texts.
+    """
+    summarizer = Summarizer()
+    # IDF statistics only matter when the query has terms to weight.
+    if _TOKEN_RE.search(query):
+        for text in texts:
+            summarizer.add_document(text)
+
+    # The query and its IDF weights are shared by every article in the batch.
+    weights = summarizer.query_weights(query)
+    return [
+        _summarize_one(
+            text,
+            query=query,
+            weights=weights,
+            metadata_title=metadata_titles[i] if metadata_titles else None,
+            max_sentences=max_sentences,
+        )
+        for i, text in enumerate(texts)
+    ]
@@ -1,12 +1,66 @@
 from __future__ import annotations
 
 import logging
+import threading
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+import soupsieve
 from bs4 import BeautifulSoup
+from bs4.builder import LXMLTreeBuilder
+from lxml import etree
 
-from utils.request_handler import RequestHandler, RequestError
+from utils.request_handler import RequestHandler, RequestError, declared_charset
+
+# Article bodies are streamed and cut off past this size so pages with huge
+# inline scripts or comment threads cannot blow up memory.
+_MAX_ARTICLE_BYTES = 5 * 1024 * 1024
+
+# CSS selectors are compiled once at import instead of on every article.
+_META_SELECTOR = soupsieve.compile("meta[content], link[rel~=canonical][href]")
+_AUTHOR_SPAN_SELECTOR = soupsieve.compile('span[class*="author" i]')
+_CONTENT_SELECTOR = soupsieve.compile("main, div[id*=content], div[class*=content]")
+
+class _ReusableLXMLTreeBuilder(LXMLTreeBuilder):
+    """
+    lxml tree builder that keeps its lxml parsers (one per candidate encoding)
+    across documents instead of constructing new ones for every page.
+    Parser options match bs4's own, so the resulting trees are identical.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._parsers: Dict[Optional[str], etree.HTMLParser] = {}
+
+    def parser_for(self, encoding: Optional[str]) -> etree.HTMLParser:
+        parser = self._parsers.get(encoding)
+        if parser is None:
+            parser = etree.HTMLParser(
+                target=self,
+                recover=True,
+                huge_tree=self.huge_tree,
+                encoding=encoding,
+            )
+            self._parsers[encoding] = parser
+        return parser
+
+    def feed(self, markup: Any) -> None:
+        try:
+            super().feed(markup)
+        except Exception:
+            # Don't reuse a parser left mid-document by a failed feed.
+            self._parsers.clear()
+            raise
+
+# Builders hold parse state, so each fetch worker thread gets its own.
+_builder_local = threading.local()
+
+def _get_tree_builder() -> _ReusableLXMLTreeBuilder:
+    builder = getattr(_builder_local, "builder", None)
+    if builder is None:
+        builder = _ReusableLXMLTreeBuilder()
+        _builder_local.builder = builder
+    return builder
 
 def _extract_metadata(soup: BeautifulSoup, url: str) -> Dict[str, Any]:
     """
@@ -24,67 +78,67 @@ def _extract_metadata(soup: BeautifulSoup, url: str) -> Dict[str, Any]:
         "languageCode": None,
     }
 
+    # Index every <meta>/<link> tag in one pass over the document instead of
+    # walking the tree once per lookup. The first tag wins for each key.
+    meta_content: Dict[str, str] = {}
+    canonical_href: Optional[str] = None
+    for tag in _META_SELECTOR.select(soup):
+        if tag.name == "link":
+            if canonical_href is None:
+                canonical_href = tag.get("href") or None
+            continue
+
+        content = tag.get("content")
+        if not content:
+            continue
+        for attr in ("property", "name"):
+            key = tag.get(attr)
+            if key:
+                meta_content.setdefault(f"{attr}:{key.lower()}", content)
+
+    def first_meta(*keys: str) -> Optional[str]:
+        for key in keys:
+            value = meta_content.get(key)
+            if value:
+                return value.strip()
+        return None
+
     # Canonical URL
-    canonical = soup.find("link", rel="canonical")
-    if canonical and canonical.get("href"):
-        metadata["canonicalUrl"] = canonical["href"]
-    else:
-        metadata["canonicalUrl"] = url
+    metadata["canonicalUrl"] = canonical_href or url
 
     # Title
     if soup.title and soup.title.string:
         metadata["title"] = soup.title.string.strip()
 
-    og_title = soup.find("meta", property="og:title") or soup.find("meta", attrs={"name": "title"})
-    if og_title and og_title.get("content"):
-        metadata["title"] = og_title["content"].strip()
+    og_title = first_meta("property:og:title", "name:title")
+    if og_title:
+        metadata["title"] = og_title
 
     # Description
-    desc = soup.find("meta", attrs={"name": "description"}) or soup.find(
-        "meta",
-        property="og:description",
-    )
-    if desc and desc.get("content"):
-        metadata["description"] = desc["content"].strip()
+    metadata["description"] = first_meta("name:description", "property:og:description")
 
     # Image
-    image_tag = soup.find("meta", property="og:image")
-    if image_tag and image_tag.get("content"):
-        metadata["image"] = image_tag["content"].strip()
+    metadata["image"] = first_meta("property:og:image")
 
     # Source / publisher
-    source = soup.find("meta", attrs={"property": "og:site_name"}) or soup.find(
-        "meta",
-        attrs={"name": "publisher"},
-    )
-    if source and source.get("content"):
-        metadata["source"] = source["content"].strip()
+    metadata["source"] = first_meta("property:og:site_name", "name:publisher")
 
     # Author
-    author = (
-        soup.find("meta", attrs={"name": "author"})
-        or soup.find("meta", property="article:author")
-        or soup.find("span", attrs={"class": lambda c: c and "author" in c.lower()})
-    )
-    if author is not None:
-        if author.name == "meta" and author.get("content"):
-            metadata["author"] = author["content"].strip()
-        elif author.string:
+    metadata["author"] = first_meta("name:author", "property:article:author")
+    if metadata["author"] is None:
+        author = _AUTHOR_SPAN_SELECTOR.select_one(soup)
+        if author is not None and author.string:
             metadata["author"] = author.string.strip()
 
     # Keywords
-    keywords = soup.find("meta", attrs={"name": "keywords"})
-    if keywords and keywords.get("content"):
-        metadata["keywords"] = keywords["content"].strip()
+    metadata["keywords"] = first_meta("name:keywords")
 
     # Published date (common meta tags)
-    published_meta = (
-        soup.find("meta", property="article:published_time")
-        or soup.find("meta", attrs={"name": "pubdate"})
-        or soup.find("meta", attrs={"name": "date"})
+    metadata["published"] = first_meta(
+        "property:article:published_time",
+        "name:pubdate",
+        "name:date",
     )
-    if published_meta and published_meta.get("content"):
-        metadata["published"] = published_meta["content"].strip()
 
     # Language code
     html_tag = soup.find("html")
@@ -109,7 +163,7 @@ def _extract_text(soup: BeautifulSoup) -> str:
         paragraphs = article_tag.find_all("p")
     else:
         # Try common content containers
-        main_candidates = soup.select("main, div[id*=content], div[class*=content]")
+        main_candidates = _CONTENT_SELECTOR.select(soup)
         for candidate in main_candidates:
             paragraphs = candidate.find_all("p")
             if paragraphs:
@@ -118,14 +172,9 @@ def _extract_text(soup: BeautifulSoup) -> str:
     if not paragraphs:
         paragraphs = soup.find_all("p")
 
-    texts = []
-    for p in paragraphs:
-        text = p.get_text(" ", strip=True)
-        if len(text) < 40:
-            continue
-        texts.append(text)
-
-    return "\n".join(texts).strip()
+    # Paragraphs are already stripped, so keep only the long ones and join once.
+    texts = (p.get_text(" ", strip=True) for p in paragraphs)
+    return "\n".join(text for text in texts if len(text) >= 40)
 
 def parse_article(
     url: str,
@@ -146,7 +195,11 @@ def parse_article(
     logging.info("Fetching article at %s", url)
 
     try:
-        response = request_handler.get(url, timeout=timeout)
+        response, body = request_handler.get_limited(
+            url,
+            timeout=timeout,
+            max_bytes=_MAX_ARTICLE_BYTES,
+        )
     except RequestError:
         raise
     except Exception as exc:  # noqa: BLE001
@@ -155,7 +208,13 @@ def parse_article(
     loaded_time = datetime.utcnow().isoformat() + "Z"
     status_code = response.status_code
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    # Raw bytes skip a decode pass, but bs4 can only see <meta> charsets, so
+    # pass along the header's charset when the server declared one.
+    soup = BeautifulSoup(
+        body,
+        builder=_get_tree_builder(),
+        from_encoding=declared_charset(response),
+    )
 
     metadata = _extract_metadata(soup, url)
     text = _extract_text(soup)
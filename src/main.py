@@ -1,20 +1,27 @@
 import argparse
-import json
 import logging
 import os
 import sys
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
+import orjson
+
 # Ensure local imports work when running as a script
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 if CURRENT_DIR not in sys.path:
     sys.path.insert(0, CURRENT_DIR)
 
 from extractors.article_parser import parse_article  # type: ignore
-from extractors.ai_summarizer import summarize  # type: ignore
-from utils.request_handler import RequestHandler, RequestError  # type: ignore
+from extractors.ai_summarizer import summarize_many  # type: ignore
+from utils.request_handler import RequestHandler, RequestError, declared_charset  # type: ignore
 from utils.data_formatter import build_article_record, write_json  # type: ignore
+from utils.search_cache import SearchCache  # type: ignore
+
+# Article fetches are I/O-bound, so threads overlap network latency well.
+_MAX_FETCH_WORKERS = 32
 
 def load_settings_example() -> Dict[str, Any]:
     """
@@ -30,6 +37,9 @@ def load_settings_example() -> Dict[str, Any]:
         "hours_back": 24,
         "request_timeout": 10,
         "user_agent": "AdvancedNewsScraper/1.0 (+https://bitbash.dev)",
+        "http_cache_seconds": 0,
+        "search_cache_seconds": 600,
+        "search_cache_path": os.path.join(".scraper_cache", "search.json"),
     }
 
     config_path = os.path.join(CURRENT_DIR, "config", "settings.example.json")
@@ -38,8 +48,8 @@ def load_settings_example() -> Dict[str, Any]:
         return default_settings
 
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            file_settings = json.load(f)
+        with open(config_path, "rb") as f:
+            file_settings = orjson.loads(f.read())
         merged = {**default_settings, **file_settings}
         return merged
     except Exception as exc:  # noqa: BLE001
@@ -63,8 +73,8 @@ def load_input_file(path: str) -> List[Dict[str, Any]]:
       ]
     }
     """
-    with open(path, "r", encoding="utf-8") as f:
-        payload = json.load(f)
+    with open(path, "rb") as f:
+        payload = orjson.loads(f.read())
 
     queries = payload.get("queries")
     if not isinstance(queries, list):
@@ -84,12 +94,21 @@ def search_news_duckduckgo(
     region: Optional[str],
     language: Optional[str],
     request_handler: RequestHandler,
+    search_cache: Optional[SearchCache] = None,
 ) -> List[str]:
     """
     Perform a lightweight DuckDuckGo HTML search and return article URLs.
 
-    This avoids API keys and keeps the project self-contained.
+    This avoids API keys and keeps the project self-contained. When a
+    search_cache is given, fresh cached results skip the request entirely.
     """
+    cache_key = SearchCache.make_key(query, region, language, max_articles)
+    if search_cache is not None:
+        cached = search_cache.get(cache_key)
+        if cached is not None:
+            logging.info("Using %d cached search results for query='%s'", len(cached), query)
+            return cached
+
     from bs4 import BeautifulSoup  # imported here to keep dependencies localized
 
     search_url = "https://duckduckgo.com/html/"
@@ -107,7 +126,7 @@ def search_news_duckduckgo(
         logging.error("Search request failed: %s", exc)
         return []
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(response.content, "lxml", from_encoding=declared_charset(response))
     urls: List[str] = []
 
     # DuckDuckGo's result links typically have class 'result__a' but may vary.
@@ -130,27 +149,46 @@ def search_news_duckduckgo(
             if len(urls) >= max_articles:
                 break
 
+    urls = urls[:max_articles]
     logging.info("Found %d candidate article URLs", len(urls))
-    return urls[:max_articles]
+    if search_cache is not None and urls:
+        search_cache.set(cache_key, urls)
+    return urls
 
+@lru_cache(maxsize=4096)
 def parse_iso8601(value: str) -> Optional[datetime]:
     """
     Best-effort ISO-8601 parsing for published timestamps.
-    Returns None if parsing fails.
+    Timezone-aware values are converted to naive UTC so they compare
+    cleanly against utcnow(). Returns None if parsing fails.
     """
     if not value:
         return None
 
     # Normalize common suffixes
     cleaned = value.strip()
+    # Every accepted form starts with "YYYY-". Non-ISO values (e.g. RFC 822
+    # dates) would fail each pattern below, so reject them before raising and
+    # catching four ValueErrors.
+    if len(cleaned) < 8 or cleaned[4] != "-" or not cleaned[:4].isdigit():
+        return None
     cleaned = cleaned.replace("Z", "+00:00")
-    # Try a couple of simple patterns
-    for fmt in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
-        try:
-            return datetime.strptime(cleaned, fmt)
-        except ValueError:
-            continue
-    return None
+
+    parsed: Optional[datetime] = None
+    try:
+        parsed = datetime.fromisoformat(cleaned)
+    except ValueError:
+        # Fall back to a couple of simple patterns
+        for fmt in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
+            try:
+                parsed = datetime.strptime(cleaned, fmt)
+                break
+            except ValueError:
+                continue
+
+    if parsed is not None and parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
 
 def filter_by_freshness(
     records: List[Dict[str, Any]],
@@ -190,6 +228,24 @@ def filter_by_freshness(
     )
     return filtered
 
+def _fetch_article(
+    url: str,
+    request_handler: RequestHandler,
+) -> Optional[Dict[str, Any]]:
+    """
+    Fetch and parse a single article URL.
+
+    Returns the parsed article, or None if it could not be fetched.
+    Runs inside a worker thread, so all errors are handled here.
+    """
+    try:
+        return parse_article(url, request_handler=request_handler)
+    except RequestError as exc:
+        logging.warning("Skipping URL due to request error: %s (url=%s)", exc, url)
+    except Exception as exc:  # noqa: BLE001
+        logging.exception("Unexpected error parsing article at %s: %s", url, exc)
+    return None
+
 def run_scraper(args: argparse.Namespace) -> None:
     settings = load_settings_example()
 
@@ -198,8 +254,17 @@ def run_scraper(args: argparse.Namespace) -> None:
         max_retries=3,
         backoff_factor=0.5,
         user_agent=settings.get("user_agent"),
+        pool_maxsize=_MAX_FETCH_WORKERS,
+        cache_expire_after=settings.get("http_cache_seconds") or None,
     )
 
+    search_cache: Optional[SearchCache] = None
+    if settings.get("search_cache_seconds"):
+        search_cache = SearchCache(
+            settings["search_cache_path"],
+            ttl_seconds=int(settings["search_cache_seconds"]),
+        )
+
     if args.input:
         queries = load_input_file(args.input)
     else:
@@ -218,57 +283,66 @@ def run_scraper(args: argparse.Namespace) -> None:
 
     all_records: List[Dict[str, Any]] = []
 
-    for q in queries:
-        query_text = q.get("query", "")
-        region = q.get("region", settings.get("region"))
-        language = q.get("language", settings.get("language"))
-        max_articles = int(q.get("max_articles", settings.get("max_articles", 10)))
-        hours_back = q.get("hours_back", settings.get("hours_back"))
-
-        logging.info(
-            "Processing query='%s' region='%s' language='%s' max_articles=%d hours_back=%s",
-            query_text,
-            region,
-            language,
-            max_articles,
-            hours_back,
-        )
-
-        urls = search_news_duckduckgo(
-            query_text,
-            max_articles=max_articles,
-            region=region,
-            language=language,
-            request_handler=request_handler,
-        )
-
-        for url in urls:
-            try:
-                article = parse_article(url, request_handler=request_handler)
-            except RequestError as exc:
-                logging.warning("Skipping URL due to request error: %s (url=%s)", exc, url)
-                continue
-            except Exception as exc:  # noqa: BLE001
-                logging.exception("Unexpected error parsing article at %s: %s", url, exc)
-                continue
+    # One pool for the whole run, so worker threads (and the per-thread
+    # parser state they build up) are reused from query to query.
+    with ThreadPoolExecutor(max_workers=_MAX_FETCH_WORKERS) as executor:
+        for q in queries:
+            query_text = q.get("query", "")
+            region = q.get("region", settings.get("region"))
+            language = q.get("language", settings.get("language"))
+            max_articles = int(q.get("max_articles", settings.get("max_articles", 10)))
+            hours_back = q.get("hours_back", settings.get("hours_back"))
+
+            logging.info(
+                "Processing query='%s' region='%s' language='%s' max_articles=%d hours_back=%s",
+                query_text,
+                region,
+                language,
+                max_articles,
+                hours_back,
+            )
 
-            ai_summary = summarize(
-                text=article.get("text", "") or "",
-                query=query_text,
-                metadata_title=article.get("title"),
+            urls = search_news_duckduckgo(
+                query_text,
+                max_articles=max_articles,
+                region=region,
+                language=language,
+                request_handler=request_handler,
+                search_cache=search_cache,
             )
 
-            record = build_article_record(
-                url=url,
-                crawl_info=article.get("crawl", {}),
-                metadata=article.get("metadata", {}),
-                ai_summary=ai_summary,
-                full_text=article.get("text", "") or "",
-                display_title=article.get("title") or ai_summary.get("title") or "",
+            futures = [
+                executor.submit(_fetch_article, url, request_handler)
+                for url in urls
+            ]
+            # Collect in submission order so output follows search ranking.
+            articles: List[Dict[str, Any]] = []
+            for future in futures:
+                article = future.result()
+                if article is not None:
+                    articles.append(article)
+
+            # Summarize the whole batch at once so IDF weights see every article.
+            summaries = summarize_many(
+                [article.get("text", "") or "" for article in articles],
+                query=query_text,
+                metadata_titles=[article.get("title") for article in articles],
             )
-            all_records.append(record)
 
-        all_records = filter_by_freshness(all_records, max_age_hours=hours_back)
+            query_records: List[Dict[str, Any]] = []
+            for article, ai_summary in zip(articles, summaries):
+                record = build_article_record(
+                    url=article["url"],
+                    crawl_info=article.get("crawl", {}),
+                    metadata=article.get("metadata", {}),
+                    ai_summary=ai_summary,
+                    full_text=article.get("text", "") or "",
+                    display_title=article.get("title") or ai_summary.get("title") or "",
+                )
+                query_records.append(record)
+
+            # Apply this query's freshness window to its own records only.
+            all_records.extend(filter_by_freshness(query_records, max_age_hours=hours_back))
 
     write_json(all_records, output_path=args.output, pretty=True)
 
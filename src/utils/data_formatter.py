@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import sys
+from typing import IO, Any, Dict, List, Optional
+
+import orjson
 
 def build_article_record(
     *,
@@ -52,6 +54,34 @@ def _ensure_parent_dir(path: str) -> None:
     if parent and not os.path.exists(parent):
         os.makedirs(parent, exist_ok=True)
 
+def _write_records(stream: IO[bytes], data: List[Dict[str, Any]], *, pretty: bool) -> None:
+    """
+    Serialize records one at a time so the full JSON document never has to
+    exist in memory. The bytes match a single orjson.dumps() of the list.
+    """
+    if not data:
+        stream.write(b"[]")
+        return
+
+    if not pretty:
+        stream.write(b"[")
+        for i, record in enumerate(data):
+            if i:
+                stream.write(b",")
+            stream.write(orjson.dumps(record))
+        stream.write(b"]")
+        return
+
+    # JSON strings never contain raw newlines, so re-indenting each line by
+    # two spaces nests the record inside the array exactly like OPT_INDENT_2.
+    stream.write(b"[\n")
+    for i, record in enumerate(data):
+        if i:
+            stream.write(b",\n")
+        stream.write(b"  ")
+        stream.write(orjson.dumps(record, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  "))
+    stream.write(b"\n]")
+
 def write_json(
     data: List[Dict[str, Any]],
     *,
@@ -63,15 +93,14 @@ def write_json(
 
     If output_path is None, the JSON is printed to stdout.
     """
-    if pretty:
-        payload = json.dumps(data, indent=2, ensure_ascii=False)
-    else:
-        payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
-
+    # orjson emits UTF-8 bytes directly (non-ASCII is not escaped).
     if output_path:
         _ensure_parent_dir(output_path)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(payload)
+        with open(output_path, "wb") as f:
+            _write_records(f, data, pretty=pretty)
         logging.info("Wrote %d records to %s", len(data), output_path)
     else:
-        print(payload)
\ No newline at end of file
+        sys.stdout.flush()
+        _write_records(sys.stdout.buffer, data, pretty=pretty)
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
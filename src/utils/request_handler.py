@@ -1,19 +1,91 @@
 from __future__ import annotations
 
 import logging
+import os
+import random
+import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
 class RequestError(RuntimeError):
     """Raised when HTTP requests repeatedly fail."""
 
+_DEFAULT_CACHE_PATH = os.path.join(".scraper_cache", "http")
+
+# Upper bounds for a single retry sleep and for a host's circuit cooldown.
+_MAX_BACKOFF_SECONDS = 10.0
+_MAX_COOLDOWN_SECONDS = 60.0
+
+_READ_CHUNK_SIZE = 64 * 1024
+
+def _create_session(cache_expire_after: Optional[int], cache_path: str) -> requests.Session:
+    """
+    Build the HTTP session, using a persistent response cache when enabled.
+
+    Caching is meant for repeated development runs; it is skipped with a
+    warning if requests-cache is not installed.
+    """
+    if not cache_expire_after:
+        return requests.Session()
+
+    try:
+        import requests_cache  # imported here to keep the dependency optional
+    except ImportError:
+        logging.warning("requests-cache is not installed; HTTP response caching is disabled.")
+        return requests.Session()
+
+    logging.info("Caching HTTP responses in %s for %d seconds", cache_path, cache_expire_after)
+    return requests_cache.CachedSession(cache_path, expire_after=cache_expire_after)
+
+def declared_charset(response: requests.Response) -> Optional[str]:
+    """
+    Return the charset named explicitly in the Content-Type header, if any.
+
+    Unlike response.encoding, this does not fall back to ISO-8859-1 for
+    text/* responses without a charset, so callers can let the HTML parser
+    sniff <meta> tags in that case.
+    """
+    content_type = response.headers.get("Content-Type", "")
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset":
+            charset = value.strip().strip("\"'")
+            return charset or None
+    return None
+
+def _read_limited(response: requests.Response, max_bytes: int) -> bytes:
+    """
+    Read a streamed response body in chunks, returning at most max_bytes.
+    The response is always closed.
+    """
+    chunks = []
+    received = 0
+    try:
+        for chunk in response.iter_content(chunk_size=_READ_CHUNK_SIZE):
+            remaining = max_bytes - received
+            if len(chunk) >= remaining:
+                chunks.append(chunk[:remaining])
+                received += remaining
+                logging.info("Truncating response from %s at %d bytes", response.url, received)
+                break
+            chunks.append(chunk)
+            received += len(chunk)
+    finally:
+        response.close()
+    return b"".join(chunks)
+
 class RequestHandler:
     """
     Simple HTTP client wrapper providing:
     - User-Agent configuration
-    - Retry with exponential backoff
+    - Retry with jittered exponential backoff
+    - Per-host circuit breaker that fast-fails hosts which keep failing
+    - Keep-alive connection pooling sized for concurrent callers
+    - Optional on-disk response caching (requires requests-cache)
     - Basic logging
     """
 
@@ -24,18 +96,57 @@ class RequestHandler:
         max_retries: int = 3,
         backoff_factor: float = 0.5,
         user_agent: Optional[str] = None,
+        pool_maxsize: int = 32,
+        cache_expire_after: Optional[int] = None,
+        cache_path: str = _DEFAULT_CACHE_PATH,
+        circuit_threshold: int = 3,
     ) -> None:
         self.timeout = timeout
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
+        self.circuit_threshold = circuit_threshold
+
+        # Circuit breaker state keyed by host; shared by worker threads.
+        self._circuit_lock = threading.Lock()
+        self._host_failures: Dict[str, int] = {}
+        self._host_cooldown_until: Dict[str, float] = {}
 
-        self.session = requests.Session()
+        self.session = _create_session(cache_expire_after, cache_path)
+        # The default pool keeps only 10 connections per host, which makes
+        # threaded callers discard and re-handshake connections.
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         headers = {
             "User-Agent": user_agent or "AdvancedNewsScraper/1.0 (+https://bitbash.dev)",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         }
         self.session.headers.update(headers)
 
+    def _circuit_open(self, host: str) -> bool:
+        with self._circuit_lock:
+            cooldown_until = self._host_cooldown_until.get(host)
+        return cooldown_until is not None and time.monotonic() < cooldown_until
+
+    def _record_success(self, host: str) -> None:
+        with self._circuit_lock:
+            self._host_failures.pop(host, None)
+            self._host_cooldown_until.pop(host, None)
+
+    def _record_failure(self, host: str) -> None:
+        with self._circuit_lock:
+            failures = self._host_failures.get(host, 0) + 1
+            self._host_failures[host] = failures
+            if failures >= self.circuit_threshold:
+                cooldown = min(_MAX_COOLDOWN_SECONDS, 2.0 ** failures)
+                self._host_cooldown_until[host] = time.monotonic() + cooldown
+                logging.warning(
+                    "Host %s failed %d times in a row; pausing requests for %.0f seconds",
+                    host,
+                    failures,
+                    cooldown,
+                )
+
     def get(
         self,
         url: str,
@@ -45,11 +156,53 @@ class RequestHandler:
     ) -> requests.Response:
         """
         Perform a GET request with retries and basic error handling.
+
+        A call whose retries all fail with connection errors or 5xx responses
+        counts once towards the host's circuit breaker; while it is open,
+        calls fail immediately with RequestError.
+        """
+        response, _ = self._get_with_retries(url, params, timeout=timeout, max_bytes=None)
+        return response
+
+    def get_limited(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        max_bytes: int,
+        timeout: Optional[int] = None,
+    ) -> Tuple[requests.Response, bytes]:
         """
+        Like get(), but stream the body and return at most max_bytes of it.
+
+        Returns the (closed) response and the body bytes read. Errors while
+        reading the body are retried like connection errors.
+        """
+        response, body = self._get_with_retries(url, params, timeout=timeout, max_bytes=max_bytes)
+        return response, body or b""
+
+    def _get_with_retries(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        *,
+        timeout: Optional[int],
+        max_bytes: Optional[int],
+    ) -> Tuple[requests.Response, Optional[bytes]]:
+        host = urlparse(url).netloc
         attempt = 0
         last_exc: Optional[Exception] = None
+        host_error = False
 
         while attempt <= self.max_retries:
+            if self._circuit_open(host):
+                if last_exc is None:
+                    raise RequestError(f"Circuit open for host {host!r}; skipping {url!r}")
+                # Another call opened the circuit while this one was retrying.
+                raise RequestError(
+                    f"Failed to fetch {url!r} after {attempt} attempts "
+                    f"(circuit open for host {host!r}): {last_exc}"
+                )
             attempt += 1
             try:
                 logging.debug("HTTP GET %s (attempt %d)", url, attempt)
@@ -58,9 +211,14 @@ class RequestHandler:
                     params=params,
                     timeout=timeout or self.timeout,
                     allow_redirects=True,
+                    stream=max_bytes is not None,
                 )
                 if 200 <= response.status_code < 400:
-                    return response
+                    body = None
+                    if max_bytes is not None:
+                        body = _read_limited(response, max_bytes)
+                    self._record_success(host)
+                    return response, body
 
                 logging.warning(
                     "Received non-success status code %s for %s",
@@ -68,13 +226,21 @@ class RequestHandler:
                     response.url,
                 )
                 last_exc = RequestError(f"HTTP {response.status_code} for {response.url}")
+                response.close()
+                if response.status_code >= 500:
+                    host_error = True
             except requests.RequestException as exc:
                 logging.warning("Request error for %s: %s", url, exc)
                 last_exc = exc
+                host_error = True
 
             if attempt <= self.max_retries:
-                sleep_for = self.backoff_factor * (2 ** (attempt - 1))
+                # Full jitter spreads retries from concurrent workers apart.
+                ceiling = min(_MAX_BACKOFF_SECONDS, self.backoff_factor * (2 ** (attempt - 1)))
+                sleep_for = random.uniform(0, ceiling)
                 logging.debug("Retrying in %.2f seconds...", sleep_for)
                 time.sleep(sleep_for)
 
-        raise RequestError(f"Failed to fetch {url!r} after {self.max_retries} retries: {last_exc}")
\ No newline at end of file
+        if host_error:
+            self._record_failure(host)
+        raise RequestError(f"Failed to fetch {url!r} after {self.max_retries} retries: {last_exc}")
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+def _is_valid_entry(entry: Any) -> bool:
+    """
+    Check that a loaded cache entry has the shape set() writes.
+    """
+    if not isinstance(entry, dict):
+        return False
+    ts = entry.get("ts")
+    urls = entry.get("urls")
+    return (
+        isinstance(ts, (int, float))
+        and not isinstance(ts, bool)
+        and isinstance(urls, list)
+        and all(isinstance(url, str) for url in urls)
+    )
+
+class SearchCache:
+    """
+    Small persistent cache for search result URLs.
+
+    Entries are stored in a single JSON file and expire after ttl_seconds.
+    The file is loaded lazily on first use and rewritten on every update,
+    which is fine for the handful of queries a run performs.
+    """
+
+    def __init__(self, path: str, *, ttl_seconds: int) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        return orjson.dumps(list(parts)).decode("utf-8")
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "rb") as f:
+                    payload = orjson.loads(f.read())
+            except Exception as exc:  # noqa: BLE001
+                logging.warning("Ignoring unreadable search cache %s: %s", self.path, exc)
+            else:
+                if isinstance(payload, dict):
+                    self._entries = {k: v for k, v in payload.items() if _is_valid_entry(v)}
+                    dropped = len(payload) - len(self._entries)
+                    if dropped:
+                        logging.warning("Dropped %d malformed entries from search cache %s", dropped, self.path)
+        return self._entries
+
+    def get(self, key: str) -> Optional[List[str]]:
+        """
+        Return cached URLs for key, or None if missing or expired.
+        """
+        entry = self._load().get(key)
+        if not entry or time.time() - entry.get("ts", 0) >= self.ttl_seconds:
+            return None
+        return entry.get("urls")
+
+    def set(self, key: str, urls: List[str]) -> None:
+        """
+        Store URLs for key and persist the cache, dropping expired entries.
+        """
+        now = time.time()
+        entries = {
+            k: v
+            for k, v in self._load().items()
+            if now - v.get("ts", 0) < self.ttl_seconds
+        }
+        entries[key] = {"urls": urls, "ts": now}
+        self._entries = entries
+
+        try:
+            parent = os.path.dirname(self.path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            with open(self.path, "wb") as f:
+                f.write(orjson.dumps(entries))
+        except OSError as exc:
+            logging.warning("Failed to write search cache %s: %s", self.path, exc)